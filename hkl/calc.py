@@ -4,6 +4,7 @@ Calculation support for diffractometers
 .. autosummary::
 
     ~default_decision_function
+    ~nearest_decision_function
     ~UnreachableError
     ~CalcRecip
 
@@ -67,6 +68,7 @@ __all__ = """
     CalcSoleilSixsMed2p3
     CalcZaxis
     default_decision_function
+    nearest_decision_function
     NM_KEV
     UnreachableError
 """.split()
@@ -84,6 +86,34 @@ def default_decision_function(position, solutions):
     return solutions[0]
 
 
+def nearest_decision_function(calc):
+    """
+    Return a decision function that picks the solution nearest the present position.
+
+    Distance is measured (over all real axes) from the physical position of
+    ``calc`` when the decision is made.  Each axis difference is wrapped
+    into [-180, 180) degrees, so 179 and -179 are 2 degrees apart.
+
+    Pass it with the ``decision_fcn`` keyword, together with the ``calc``
+    instance it watches (``calc_inst``)::
+
+        calc = CalcE4CV(engine="hkl", lock_engine=True)
+        fourc = SimulatedE4CV(
+            "", name="fourc",
+            calc_inst=calc,
+            decision_fcn=nearest_decision_function(calc),
+        )
+    """
+
+    def decision(position, solutions):
+        reals = np.asarray(solutions, dtype=float)
+        here = np.asarray(calc.physical_positions, dtype=float)
+        delta = (reals - here + 180) % 360 - 180
+        return solutions[int(np.argmin((delta**2).sum(axis=1)))]
+
+    return decision
+
+
 # This is used below by CalcRecip.
 def _locked(func):
     """a decorator for running a method with the instance's lock"""
@@ -144,6 +174,7 @@ class CalcRecip(object):
         ~engines
         ~forward
         ~forward_iter
+        ~forward_many
         ~geometry_name
         ~geometry_table
         ~get_path
@@ -711,6 +742,33 @@ class CalcRecip(object):
             self.engine.pseudo_positions = position
             return self.engine.solutions
 
+    @_keep_physical_position
+    def forward_many(self, positions, engine=None):
+        """
+        Calculate real positions for each of several pseudo positions.
+
+        Each position is solved from the same starting physical position,
+        as :meth:`forward` would.
+
+        Returns a list with the solutions for each position, in order.
+        The entry is ``None`` for a position that could not be solved.
+        """
+        initial_pos = self.physical_positions
+        results = []
+        with UsingEngine(self, engine):
+            if self.engine is None:
+                raise ValueError("Engine unset")
+
+            for position in positions:
+                try:
+                    self.engine.pseudo_positions = position
+                    results.append(self.engine.solutions)
+                except ValueError:
+                    results.append(None)
+                finally:
+                    self.physical_positions = initial_pos
+        return results
+
     @_keep_physical_position
     def inverse(self, real):
         """Calculate pseudo positions from real positions."""
@@ -11,8 +11,10 @@ Common Support for diffractometers
 """
 
 import logging
+import threading
+from collections import OrderedDict
 
-import pint
+import numpy as np
 import pyRestTable
 from ophyd import Component as Cpt
 from ophyd import PositionerBase
@@ -32,6 +34,51 @@ __all__ = """
 """.split()
 logger = logging.getLogger(__name__)
 
+# energy_update_calc_flag values that permit updates to calc.energy
+_ENERGY_UPDATE_OK = frozenset((1, "Yes", "locked", "OK", True, "On"))
+
+
+class _SampleCachedMixin:
+    """
+    Signal mixin: re-use the last value until the current sample changes.
+
+    The value is read again after a different sample is selected or the
+    sample reports a change (``HklSample._generation``) to its lattice,
+    orientation, or reflections.
+
+    Each ``get()`` returns a copy, so a caller that changes the result
+    in place does not change the cached value.
+    """
+
+    _sample_key = None
+    _sample_value = None
+
+    def get(self, **kwargs):
+        sample = self.parent.calc.sample
+        key = (sample, sample._generation)
+        if self._sample_key != key:
+            self._sample_value = super().get(**kwargs)
+            self._sample_key = key
+        value = self._sample_value
+        if isinstance(value, np.ndarray):
+            return np.array(value, copy=True)
+        if isinstance(value, list):
+            # such as reflections: [[h, k, l], ...]
+            return [list(item) if isinstance(item, list) else item for item in value]
+        return value
+
+    def invalidate(self):
+        """Read the value from the sample on the next ``get()``."""
+        self._sample_key = None
+
+
+class _SampleCachedAttributeSignal(_SampleCachedMixin, AttributeSignal):
+    """AttributeSignal cached per sample change."""
+
+
+class _SampleCachedArrayAttributeSignal(_SampleCachedMixin, ArrayAttributeSignal):
+    """ArrayAttributeSignal cached per sample change."""
+
 
 class Diffractometer(PseudoPositioner):
     """Diffractometer pseudopositioner
@@ -43,6 +90,7 @@ class Diffractometer(PseudoPositioner):
         ~calc
         ~engine
         ~forward
+        ~forward_batch
         ~inverse
         ~forward_solutions_table
         ~apply_constraints
@@ -58,15 +106,26 @@ class Diffractometer(PseudoPositioner):
 
     .. autosummary::
 
+        ~_calc_axes
         ~_calc_energy_update_permitted
+        ~_check_value_dict
+        ~_connection_changed
         ~_constraints_dict
         ~_constraints_for_databroker
+        ~_debounced_energy_update
         ~_energy_changed
         ~_energy_offset_changed
         ~_energy_units_changed
+        ~_forward_cache_key
+        ~_forward_decide
+        ~_forward_raw
+        ~_invalidate_forward_cache
+        ~_is_connected
         ~_push_current_constraints
+        ~_request_calc_energy_update
         ~_set_constraints
         ~_update_calc_energy
+        ~_update_calc_energy_unchecked
 
     A Diffractometer has a corresponding calculation engine from **hklpy** that does
     forward and inverse calculations.
@@ -88,6 +147,12 @@ class Diffractometer(PseudoPositioner):
         The decision function to use when multiple solutions exist for a given
         forward calculation. Defaults to arbitrarily picking the first
         solution.
+    forward_cache_size : int, optional
+        Number of decided ``forward()`` solutions to remember.  A cached
+        solution is returned without calling the decision function again,
+        so do not use this with a decision function that has state or side
+        effects (such as one that reads the present position).
+        Default: ``0`` (no cache)
     engine : str, optional
         Calculation engine name.  Default: ``hkl``
     read_attrs : list, optional
@@ -160,24 +225,24 @@ class Diffractometer(PseudoPositioner):
     sample_name = Cpt(AttributeSignal, attr="calc.sample_name", doc="Sample name")
     lattice = Cpt(
         # fmt: off
-        ArrayAttributeSignal,
+        _SampleCachedArrayAttributeSignal,
         attr="calc.sample.lattice",
         doc="Sample lattice",
         # fmt: on
     )
     lattice_reciprocal = Cpt(
         # fmt: off
-        AttributeSignal,
+        _SampleCachedAttributeSignal,
         attr="calc._cfg_reciprocal",
         doc="Reciprocal lattice",
         # fmt: on
     )
 
-    U = Cpt(AttributeSignal, attr="calc.sample.U", doc="U matrix")
-    UB = Cpt(AttributeSignal, attr="calc.sample.UB", doc="UB matrix")
+    U = Cpt(_SampleCachedAttributeSignal, attr="calc.sample.U", doc="U matrix")
+    UB = Cpt(_SampleCachedAttributeSignal, attr="calc.sample.UB", doc="UB matrix")
     # fmt: off
     reflections = Cpt(
-        AttributeSignal,
+        _SampleCachedAttributeSignal,
         attr="_reflections",
         doc="Reflections",
     )
@@ -187,17 +252,17 @@ class Diffractometer(PseudoPositioner):
         doc="Details of reflections",
     )
     ux = Cpt(
-        AttributeSignal,
+        _SampleCachedAttributeSignal,
         attr="calc.sample.ux.value",
         doc="ux portion of the U matrix",
     )
     uy = Cpt(
-        AttributeSignal,
+        _SampleCachedAttributeSignal,
         attr="calc.sample.uy.value",
         doc="uy portion of the U matrix",
     )
     uz = Cpt(
-        AttributeSignal,
+        _SampleCachedAttributeSignal,
         attr="calc.sample.uz.value",
         doc="uz portion of the U matrix",
     )
@@ -260,6 +325,16 @@ class Diffractometer(PseudoPositioner):
     max_forward_iterations = Cpt(Signal, value=100, kind="config")
     # fmt: on
 
+    # Number of decided forward() solutions to remember.  Zero: no cache.
+    _forward_cache_size = 0
+
+    # Seconds to wait for a burst of energy updates to settle before
+    # updating calc.energy once.  Zero: update on each change.
+    _energy_debounce = 0
+
+    # keV per one of the named energy units, shared by all instances.
+    _UNIT_SCALE_CACHE = {}
+
     # fmt: off
     def __init__(
         self,
@@ -271,6 +346,7 @@ class Diffractometer(PseudoPositioner):
         *,
         configuration_attrs=None,
         read_attrs=None,
+        forward_cache_size=0,
         **kwargs,
     ):
         # fmt: on
@@ -310,6 +386,8 @@ class Diffractometer(PseudoPositioner):
             decision_fcn = calc.default_decision_function
 
         self._decision_fcn = decision_fcn
+        self._forward_cache = OrderedDict()
+        self._forward_cache_size = forward_cache_size
 
         super().__init__(
             # fmt: off
@@ -323,18 +401,56 @@ class Diffractometer(PseudoPositioner):
         for attr in self.orientation_attrs.get():
             getattr(self, attr).kind = "config"
         self.energy_update_calc_flag.kind = "config"
+
+        # positioners by attribute name, for check_value()
+        self._pseudo_by_name = {p.attr_name: p for p in self.pseudo_positioners}
+        self._real_by_name = {p.attr_name: p for p in self.real_positioners}
+        self._pseudo_attr_names = tuple(self._pseudo_by_name)
         self.orientation_attrs.kind = "config"  # orientation written as descriptors
         self._constraints_stack = []
-
-        self.energy.subscribe(self._energy_changed, event_type=Signal.SUB_VALUE)
-        self.energy_offset.subscribe(self._energy_offset_changed, event_type=Signal.SUB_VALUE)
-        self.energy_units.subscribe(self._energy_units_changed, event_type=Signal.SUB_VALUE)
+        self._calc_axes_cache = None
+
+        # Remember once the device is connected, rather than walking
+        # every component from each energy callback.
+        self._cached_connected = False
+        for walk in self.walk_signals():
+            walk.item.subscribe(self._connection_changed, event_type=Signal.SUB_META, run=False)
+
+        self._energy_lock = threading.Lock()
+        self._energy_timer = None
+        self._energy_units = None  # last value from energy_units (None: not yet known)
+
+        # run=True (default): a value already received (such as from an
+        # EPICS PV that connected during construction) updates calc.energy.
+        for signal, callback in (
+            (self.energy, self._energy_changed),
+            (self.energy_offset, self._energy_offset_changed),
+            (self.energy_units, self._energy_units_changed),
+        ):
+            signal.subscribe(callback, event_type=Signal.SUB_VALUE)
 
     @property
     def _calc_energy_update_permitted(self):
         """return boolean `True` if permitted"""
-        acceptable_values = (1, "Yes", "locked", "OK", True, "On")
-        return self.energy_update_calc_flag.get() in acceptable_values
+        return self.energy_update_calc_flag.get() in _ENERGY_UPDATE_OK
+
+    @property
+    def _is_connected(self):
+        """Cached ``self.connected``, re-checked only until it is ``True``."""
+        if not self._cached_connected:
+            self._cached_connected = self.connected
+        return self._cached_connected
+
+    def _connection_changed(self, connected=True, **kwargs):
+        """
+        Callback indicating that the connection state of a signal changed.
+
+        .. note::
+            Every signal of this device is subscribed to this method
+            in the :meth:`Diffractometer.__init__()` method.
+        """
+        if not connected:
+            self._cached_connected = False
 
     def _energy_changed(self, value=None, **kwargs):
         """
@@ -344,7 +460,7 @@ class Diffractometer(PseudoPositioner):
             The `energy` signal is subscribed to this method
             in the :meth:`Diffractometer.__init__()` method.
         """
-        if not self.connected:
+        if not self._is_connected:
             logger.warning(
                 # fmt: off
                 "%s not fully connected, %s.calc.energy not updated",
@@ -355,7 +471,7 @@ class Diffractometer(PseudoPositioner):
             return
 
         if self._calc_energy_update_permitted:
-            self._update_calc_energy()
+            self._request_calc_energy_update()
 
     def _energy_offset_changed(self, value=None, **kwargs):
         """
@@ -365,7 +481,7 @@ class Diffractometer(PseudoPositioner):
             The ``energy_offset`` signal is subscribed to this method
             in the :meth:`Diffractometer.__init__()` method.
         """
-        if not self.connected:
+        if not self._is_connected:
             logger.warning(
                 # fmt: off
                 "%s not fully connected, %s.calc.energy not updated",
@@ -376,7 +492,7 @@ class Diffractometer(PseudoPositioner):
             return
 
         if self._calc_energy_update_permitted:
-            self._update_calc_energy()
+            self._request_calc_energy_update()
 
     def _energy_units_changed(self, value=None, **kwargs):
         """
@@ -386,7 +502,8 @@ class Diffractometer(PseudoPositioner):
             The ``energy_units`` signal is subscribed to this method
             in the :meth:`Diffractometer.__init__()` method.
         """
-        if not self.connected:
+        self._energy_units = value
+        if not self._is_connected:
             logger.warning(
                 # fmt: off
                 "%s not fully connected, %s.calc.energy not updated",
@@ -397,7 +514,42 @@ class Diffractometer(PseudoPositioner):
             return
 
         if self._calc_energy_update_permitted:
-            self._update_calc_energy()
+            self._request_calc_energy_update()
+
+    def _request_calc_energy_update(self):
+        """
+        Update ``calc.energy`` now or, with ``_energy_debounce``, once settled.
+
+        Updates requested while one is pending are coalesced: the pending
+        update reads the energy signals when it runs.
+        """
+        if self._energy_debounce <= 0:
+            self._update_calc_energy_unchecked()
+            return
+
+        with self._energy_lock:
+            if self._energy_timer is None:
+                self._energy_timer = threading.Timer(self._energy_debounce, self._debounced_energy_update)
+                self._energy_timer.daemon = True
+                self._energy_timer.start()
+
+    def _debounced_energy_update(self):
+        """Run the pending ``calc.energy`` update (from the timer thread)."""
+        with self._energy_lock:
+            self._energy_timer = None
+        # serialized with forward() and inverse() in other threads
+        with self.calc._lock:
+            # updates may have been disabled, or the connection lost, while waiting
+            if self._calc_energy_update_permitted:
+                self._update_calc_energy()
+
+    def destroy(self):
+        """Cancel any pending ``calc.energy`` update, then destroy the device."""
+        with self._energy_lock:
+            timer, self._energy_timer = self._energy_timer, None
+        if timer is not None:
+            timer.cancel()
+        super().destroy()
 
     def _update_calc_energy(self, value=None, **kwargs):
         """
@@ -412,21 +564,37 @@ class Diffractometer(PseudoPositioner):
                 # fmt: on
             )
             return
+        self._update_calc_energy_unchecked()
 
+    def _update_calc_energy_unchecked(self):
+        """
+        ``_update_calc_energy()`` for callers that checked the connection.
+        """
         value = float(self.energy.get())
 
         # energy_offset has same units as energy
         value += self.energy_offset.get()
 
         # comment these lines to skip unit conversion
-        units = self.energy_units.get()
+        units = self._energy_units
+        if units is None:
+            units = self.energy_units.get()
         if units != "keV":
-            keV = pint.Quantity(value, units).to("keV")
-            value = keV.magnitude
+            scale = self._UNIT_SCALE_CACHE.get(units)
+            if scale is None:
+                import pint  # deferred: only needed for units other than keV
+
+                scale = pint.Quantity(1.0, units).to("keV").magnitude
+                self._UNIT_SCALE_CACHE[units] = scale
+            value *= scale
 
         if value <= 0:
             logger.debug("Computed energy(%s) is not positive", value)
             return
+        if abs(value - self.calc.energy) < 1e-9:
+            # e.g. a monitor re-publishing an identical value
+            logger.debug("%s.calc.energy unchanged (%s keV)", self.name, value)
+            return
         logger.debug("setting %s.calc.energy = %s (keV)", self.name, value)
         self.calc.energy = value
         self._update_position()
@@ -457,23 +625,122 @@ class Diffractometer(PseudoPositioner):
         Calculate the real positions given the pseudo positions (hkl -> angles).
 
         Return the default solution using the ``_decision_fcn()``.
+
+        With ``forward_cache_size`` (default: off), decided solutions are
+        remembered.  When the same pseudo position is requested again with
+        unchanged sample, energy, mode, geometry, and constraints, the
+        remembered solution is returned *without* calling the decision
+        function again.
+        """
+        return self._forward_raw(pseudo)
+
+    def _forward_raw(self, pseudo):
+        """
+        ``forward()`` without the argument handling of its decorator.
+
+        ``pseudo`` must already be a ``PseudoPosition``.
+        """
+        with self.calc._lock:
+            if self._forward_cache_size <= 0:
+                return self._forward_decide(pseudo)[0]
+
+            key = self._forward_cache_key(pseudo)
+            solution = self._forward_cache.pop(key, None)
+            if solution is None:
+                solution, remember = self._forward_decide(pseudo)
+                if not remember:
+                    return solution
+
+            # most recently used entries are kept at the end
+            self._forward_cache[key] = solution
+            while len(self._forward_cache) > self._forward_cache_size:
+                self._forward_cache.popitem(last=False)
+            return solution
+
+    def _forward_decide(self, pseudo):
         """
+        Compute the ``forward()`` solutions and choose one (no cache).
+
+        Returns ``(solution, remember)``.  ``remember`` is ``False`` when
+        the solutions came from ``forward_iter()``, which starts from the
+        present position (not part of the cache key).
+        """
+        remember = True
         try:
             solutions = self.calc.forward(list(pseudo))
         except ValueError:
             solutions = self.calc.forward_iter(
                 start=self.position, end=pseudo, max_iters=self.max_forward_iterations.get()
             )
+            remember = False
         logger.debug("pseudo to real: %s", solutions)
-        return self._decision_fcn(pseudo, solutions)
+        return self._decision_fcn(pseudo, solutions), remember
+
+    def forward_batch(self, pseudos):
+        """
+        Calculate the real positions for each of several pseudo positions.
+
+        Intended for plans that need many ``forward()`` computations
+        (such as a list or grid of (hkl) positions).
+
+        Parameters
+        ----------
+        pseudos : array-like
+            Pseudo positions, one per row: ``[(h, k, l), ...]``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Real positions, one row per pseudo position and one column per
+            real positioner, as chosen by the decision function.
+        """
+        pseudos = np.atleast_2d(np.asarray(pseudos, dtype=float))
+        if pseudos.ndim != 2 or pseudos.shape[1] != len(self.PseudoPosition._fields):
+            raise ValueError(f"Expected rows of {self.PseudoPosition._fields}, received shape {pseudos.shape}")
+
+        reals = np.empty((len(pseudos), len(self.RealPosition._fields)))
+        for i, pseudo in enumerate(pseudos):
+            reals[i] = self._forward_raw(self.PseudoPosition(*pseudo))
+        return reals
+
+    def _forward_cache_key(self, pseudo):
+        """
+        Return a hashable fingerprint of the inputs to a ``forward()`` solution.
+
+        The current axis values are part of the key since modes that hold an
+        axis constant take its value from the present geometry.  The limits
+        and fit of each axis (the constraints) are included, since they may
+        be changed through ``calc[axis]`` as well as ``apply_constraints()``.
+        """
+        calc = self.calc
+        geometry = calc._geometry
+        units = calc._units
+        axes = [geometry.axis_get(name) for name in geometry.axis_names_get()]
+        return (
+            calc.sample.UB.tobytes(),
+            calc.energy,
+            calc.engine.mode,
+            tuple(calc.engine.parameters_values),
+            tuple(geometry.axis_values_get(units)),
+            tuple((tuple(axis.min_max_get(units)), axis.fit_get()) for axis in axes),
+            tuple(calc._inverted_axes),
+            tuple(round(v, 9) for v in pseudo),
+            self._decision_fcn,
+            self.max_forward_iterations.get(),
+        )
+
+    def _invalidate_forward_cache(self):
+        """Forget all memoized ``forward()`` solutions."""
+        self._forward_cache.clear()
 
     @real_position_argument
     def inverse(self, real):
         """
         Calculate the pseudo positions given the real positions (angles -> hkl).
         """
-        self.calc.physical_positions = real
-        return self.PseudoPosition(*self.calc.pseudo_positions)
+        with self.calc._lock:
+            self.calc.physical_positions = real
+            return self.PseudoPosition(*self.calc.pseudo_positions)
 
     def check_value(self, pos):
         """
@@ -486,18 +753,25 @@ class Diffractometer(PseudoPositioner):
         It is not permitted to scan both pseudo and real positioners.
         """
         if isinstance(pos, dict):
-            # Redefine and fill in any missing values.
+            pos = self._check_value_dict(pos)
+        super().check_value(pos)
 
-            for axis, target in pos.items():
-                if hasattr(self, axis):
-                    p = getattr(self, axis)
-                    if p in self.real_positioners:
-                        p.check_value(target)
-                else:
-                    raise KeyError(f"{axis} not in {self.name}")
+    def _check_value_dict(self, pos):
+        """
+        Check any real axes in ``pos``, return the complete pseudo position.
 
-            pos = [pos.get(p.attr_name, p.position) for p in self.pseudo_positioners]
-        super().check_value(pos)
+        Pseudo axes missing from ``pos`` keep their current positions.
+        """
+        for axis, target in pos.items():
+            p = self._real_by_name.get(axis)
+            if p is not None:
+                p.check_value(target)
+            elif not hasattr(self, axis):
+                raise KeyError(f"{axis} not in {self.name}")
+
+        # read .position only for the pseudo axes not given
+        pseudos = self._pseudo_by_name
+        return tuple(pos[name] if name in pos else pseudos[name].position for name in self._pseudo_attr_names)
 
     def apply_constraints(self, constraints):
         """
@@ -515,18 +789,29 @@ class Diffractometer(PseudoPositioner):
             self._set_constraints(self._constraints_stack[0])
             self._constraints_stack = []
 
+    @property
+    def _calc_axes(self):
+        """
+        Return ``{name: calc[name]}`` for the real positioners.
+
+        The handles are kept until the calc replaces its geometry
+        (see ``TemporaryGeometry``) or the inverted or renamed axes change.
+        """
+        calc = self.calc
+        geometry = calc._geometry
+        names = (tuple(calc._inverted_axes), tuple(calc._axis_name_to_original.items()))
+        cached = self._calc_axes_cache
+        if cached is None or cached[0] is not geometry or cached[1] != names:
+            axes = {m: calc[m] for m in self.RealPosition._fields}
+            self._calc_axes_cache = cached = (geometry, names, axes)
+        return cached[2]
+
     @property
     def _constraints_dict(self):
         """Return the constraints."""
         return {
-            # fmt:off
-            m: Constraint(
-                *self.calc[m].limits,
-                self.calc[m].value,
-                self.calc[m].fit,
-            )
-            # fmt:on
-            for m in self.RealPosition._fields
+            m: Constraint(*axis.limits, axis.value, axis.fit)
+            for m, axis in self._calc_axes.items()
         }
 
     @property
@@ -540,12 +825,8 @@ class Diffractometer(PseudoPositioner):
         float.) The constraints will be written in the order of the real
         positioners.
         """
-        # fmt: off
-        return [
-            tuple(self._constraints_dict[p]._asdict().values())
-            for p in self.RealPosition._fields
-        ]
-        # fmt: on
+        constraints = self._constraints_dict
+        return [tuple(constraints[p]) for p in self.RealPosition._fields]
 
     def get_axis_constraints(self, axis):
         """Show the constraints for one axis."""
@@ -572,21 +853,22 @@ class Diffractometer(PseudoPositioner):
 
     def _push_current_constraints(self):
         """push current constraints onto the stack"""
-        constraints = {
-            m: Constraint(*self.calc[m].limits, self.calc[m].value, self.calc[m].fit)
-            for m in self.real_positioners._fields
-        }
-        self._constraints_stack.append(constraints)
+        self._constraints_stack.append(self._constraints_dict)
 
     def _set_constraints(self, constraints):
         """set diffractometer's constraints"""
+        self._invalidate_forward_cache()
+        calc_axes = self._calc_axes
         for axis, constraint in constraints.items():
-            self.calc[axis].limits = [
+            param = calc_axes.get(axis)
+            if param is None:
+                param = self.calc[axis]
+            param.limits = [
                 constraint.low_limit,
                 constraint.high_limit,
             ]
-            self.calc[axis].value = constraint.value
-            self.calc[axis].fit = constraint.fit
+            param.value = constraint.value
+            param.fit = constraint.fit
 
     def forward_solutions_table(self, reflections, full=False, digits=5):
         """
@@ -609,12 +891,10 @@ class Diffractometer(PseudoPositioner):
         _table = pyRestTable.Table()
         motors = self.real_positioners._fields
         _table.labels = "(hkl) solution".split() + list(motors)
-        for reflection in reflections:
-            try:
-                solutions = self.calc.forward(reflection)
-            except ValueError as exc:
-                solutions = exc
-            if isinstance(solutions, ValueError):
+        reflections = list(reflections)
+        all_solutions = self.calc.forward_many(reflections)
+        for reflection, solutions in zip(reflections, all_solutions):
+            if solutions is None:
                 row = [reflection, "none"]
                 row += ["" for m in motors]
                 _table.addRow(row)
@@ -677,27 +957,31 @@ class Diffractometer(PseudoPositioner):
         def addTable(tbl):
             return str(tbl).strip()
 
-        def Package(**kwargs):
-            return ", ".join([f"{k}={v}" for k, v in kwargs.items()])
+        def Package(pairs):
+            return ", ".join(f"{k}={v}" for k, v in pairs)
+
+        calc = self.calc
+        engine = calc.engine
+        to_original = calc._axis_name_to_original
 
         table = pyRestTable.Table()
         table.labels = "term value".split()
 
         table.addRow(("diffractometer", self.name))
-        table.addRow(("geometry", self.calc._geometry.name_get()))
+        table.addRow(("geometry", calc._geometry.name_get()))
         table.addRow(("class", self.__class__.__name__))
-        table.addRow(("energy (keV)", f"{self.calc.energy:.5f}"))
-        table.addRow(("wavelength (angstrom)", f"{self.calc.wavelength:.5f}"))
-        table.addRow(("calc engine", self.calc.engine.name))
-        table.addRow(("mode", self.calc.engine.mode))
+        table.addRow(("energy (keV)", f"{calc.energy:.5f}"))
+        table.addRow(("wavelength (angstrom)", f"{calc.wavelength:.5f}"))
+        table.addRow(("calc engine", engine.name))
+        table.addRow(("mode", engine.mode))
 
         pt = pyRestTable.Table()
         pt.labels = "name value".split()
-        if self.calc._axis_name_to_original:
+        if to_original:
             pt.addLabel("original name")
         for item in self.real_positioners:
             row = [item.attr_name, f"{item.position:.5f}"]
-            k = self.calc._axis_name_to_original.get(item.attr_name)
+            k = to_original.get(item.attr_name)
             if k is not None:
                 row.append(k)
             pt.addRow(row)
@@ -706,61 +990,33 @@ class Diffractometer(PseudoPositioner):
         t = self.show_constraints(printing=False)
         table.addRow(("constraints", addTable(t)))
 
+        axis_names = calc.physical_axis_names
+        units = calc._units
         if all_samples:
-            samples = self.calc._samples.values()
+            samples = calc._samples.values()
         else:
-            samples = [self.calc._sample]
+            samples = [calc._sample]
         for sample in samples:
             t = pyRestTable.Table()
             t.labels = "term value".split()
             nm = sample.name
-            if all_samples and sample == self.calc.sample:
+            if all_samples and sample == calc.sample:
                 nm += " (*)"
 
-            # fmt: off
-            t.addRow(
-                (
-                    "unit cell edges",
-                    Package(
-                        **{
-                            k: getattr(sample.lattice, k)
-                            for k in "a b c".split()
-                        }
-                    ),
-                )
-            )
-            t.addRow(
-                (
-                    "unit cell angles",
-                    Package(
-                        **{
-                            k: getattr(sample.lattice, k)
-                            for k in "alpha beta gamma".split()
-                        }
-                    ),
-                )
-            )
-            # fmt: on
+            lattice = sample.lattice  # read from libhkl once per sample
+            pairs = list(zip(lattice._fields, lattice))  # a b c alpha beta gamma
+            t.addRow(("unit cell edges", Package(pairs[:3])))
+            t.addRow(("unit cell angles", Package(pairs[3:])))
 
             for i, ref in enumerate(sample._sample.reflections_get()):
-                h, k, l = ref.hkl_get()
-                pos_arr = ref.geometry_get().axis_values_get(self.calc._units)
-                t.addRow((f"ref {i+1} (hkl)", Package(**dict(h=h, k=k, l=l))))
-                # fmt: off
+                pos_arr = ref.geometry_get().axis_values_get(units)
+                t.addRow((f"ref {i+1} (hkl)", "h={}, k={}, l={}".format(*ref.hkl_get())))
                 t.addRow(
                     (
                         f"ref {i+1} positioners",
-                        Package(
-                            **{
-                                k: f"{v:.5f}"
-                                for k, v in zip(
-                                    self.calc.physical_axis_names, pos_arr
-                                )
-                            }
-                        ),
+                        ", ".join(f"{k}={v:.5f}" for k, v in zip(axis_names, pos_arr)),
                     )
                 )
-                # fmt: on
 
             t.addRow(("[U]", sample.U))
             t.addRow(("[UB]", sample.UB))
@@ -813,17 +1069,20 @@ class Diffractometer(PseudoPositioner):
             40.000000   20.000000   90.000000   57.048500   77.044988  134.755995  114.093455
 
         """
+        calc = self.calc
+        engine = calc.engine
+
         table = pyRestTable.Table()
         table.labels = "term value axis_type".split()
         table.addRow(("diffractometer", self.name, ""))
-        table.addRow(("sample name", self.calc.sample.name, ""))
-        table.addRow(("energy (keV)", f"{self.calc.energy:.5f}", ""))
-        table.addRow(("wavelength (angstrom)", f"{self.calc.wavelength:.5f}", ""))
-        table.addRow(("calc engine", self.calc.engine.name, ""))
-        table.addRow(("mode", self.calc.engine.mode, ""))
-
-        pseudo_axes = [v.attr_name for v in self._pseudo]
-        real_axes = [v.attr_name for v in self._real]
+        table.addRow(("sample name", calc.sample.name, ""))
+        table.addRow(("energy (keV)", f"{calc.energy:.5f}", ""))
+        table.addRow(("wavelength (angstrom)", f"{calc.wavelength:.5f}", ""))
+        table.addRow(("calc engine", engine.name, ""))
+        table.addRow(("mode", engine.mode, ""))
+
+        pseudo_axes = {v.attr_name for v in self._pseudo}
+        real_axes = {v.attr_name for v in self._real}
         for k in self._sig_attrs.keys():
             v = getattr(self, k)
             if not issubclass(v.__class__, PositionerBase):
@@ -10,8 +10,6 @@ Low-level support to Hkl computation engine support for diffractometers
 
 """
 
-from __future__ import print_function
-
 import logging
 from collections import OrderedDict
 
@@ -30,6 +28,11 @@ AXES_READ = 0
 AXES_WRITTEN = 1
 
 
+def _solution_position(item, units, Position):
+    """Real axis positions of one item from a geometry list."""
+    return Position(*item.geometry_get().axis_values_get(units))
+
+
 class Parameter(object):
     """HKL library parameter object
 
@@ -179,6 +182,8 @@ class Solution(object):
         self._list_item = list_item.copy()
         self._geometry = list_item.geometry_get().copy()
         self._engine = engine
+        self._axis_names = None
+        self._positions = None
 
     def __getitem__(self, axis):
         return self._geometry.axis_get(axis)
@@ -186,12 +191,17 @@ class Solution(object):
     @property
     def axis_names(self):
         """List real axis names of the solution."""
-        return self._geometry.axis_names_get()
+        if self._axis_names is None:
+            self._axis_names = tuple(self._geometry.axis_names_get())
+        return list(self._axis_names)
 
     @property
     def positions(self):
         """List real axis values of the solution."""
-        return self._class(*self._geometry.axis_values_get(self._engine._units))
+        # the geometry is a private copy: its values do not change
+        if self._positions is None:
+            self._positions = self._class(*self._geometry.axis_values_get(self._engine._units))
+        return self._positions
 
     @property
     def units(self):
@@ -238,6 +248,11 @@ class Engine(object):
         self._engine = engine
         self._engine_list = engine_list
 
+        # The pseudo axes belong to the engine (not its mode): read once.
+        self._pseudo_axis_names = tuple(engine.pseudo_axis_names_get())
+        self._pseudo_axis_index = {name: i for i, name in enumerate(self._pseudo_axis_names)}
+        self._modes = tuple(engine.modes_names_get())
+
     @property
     def name(self):
         """Name of this engine."""
@@ -265,19 +280,19 @@ class Engine(object):
 
     @mode.setter
     def mode(self, mode):
-        if mode not in self.modes:
-            raise ValueError("Unrecognized mode %r; choose from: %s" % (mode, ", ".join(self.modes)))
+        if mode not in self._modes:
+            raise ValueError("Unrecognized mode %r; choose from: %s" % (mode, ", ".join(self._modes)))
 
         return self._engine.current_mode_set(mode)
 
     @property
     def modes(self):
-        return self._engine.modes_names_get()
+        return list(self._modes)
 
     @property
     def solutions(self):
         """Allowed real solutions given the pseudo position."""
-        return tuple(self._solutions)
+        return self._solutions
 
     def update(self):
         """Calculate the pseudo axis positions from the real axis positions."""
@@ -300,12 +315,12 @@ class Engine(object):
     @property
     def pseudo_axis_names(self):
         """List the names of the pseudo axes."""
-        return self._engine.pseudo_axis_names_get()
+        return list(self._pseudo_axis_names)
 
     @property
     def pseudo_axes(self):
         """List of pseudo axes as tuples: ``[(name, value)]``."""
-        return OrderedDict(zip(self.pseudo_axis_names, self.pseudo_positions))
+        return OrderedDict(zip(self._pseudo_axis_names, self.pseudo_positions))
 
     @property
     def pseudo_positions(self):
@@ -320,24 +335,22 @@ class Engine(object):
             raise ValueError("Calculation failed (%s)" % ex)
 
         Position = self._calc.Position
-
-        def get_position(item):
-            return Position(*item.geometry_get().axis_values_get(self._units))
-
-        self._solutions = [get_position(item) for item in geometry_list.items()]
+        units = self._units
+        self._solutions = tuple(_solution_position(item, units, Position) for item in geometry_list.items())
 
     def __getitem__(self, name):
         try:
-            return self.pseudo_axes[name]
+            idx = self._pseudo_axis_index[name]
         except KeyError:
             raise ValueError("Unknown axis name: %s" % name)
+        return self.pseudo_positions[idx]
 
     def __setitem__(self, name, value):
-        values = self.pseudo_positions
         try:
-            idx = self.pseudo_axis_names.index(name)
-        except IndexError:
+            idx = self._pseudo_axis_index[name]
+        except KeyError:
             raise ValueError("Unknown axis name: %s" % name)
+        values = self.pseudo_positions
 
         values[idx] = float(value)
         self.pseudo_positions = values
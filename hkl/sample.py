@@ -1,6 +1,7 @@
 """Sample on the diffractometer."""
 
 import logging
+import math
 
 import numpy as np
 
@@ -34,20 +35,15 @@ def check_lattice(lattice):
     beta = lattice.beta_get()
     gamma = lattice.gamma_get()
 
-    lt = Lattice(a, b, c, alpha, beta, gamma)
-    for k, v in lt._asdict().items():
+    params = (a, b, c, alpha, beta, gamma)
+    for k, v in zip(Lattice._fields, params):
         if v is None:
             raise ValueError(f'Lattice parameter "{k}" unset or invalid')
 
-    lt = Lattice(
-        a.value_get(util.units["user"]),
-        b.value_get(util.units["user"]),
-        c.value_get(util.units["user"]),
-        alpha.value_get(util.units["user"]),
-        beta.value_get(util.units["user"]),
-        gamma.value_get(util.units["user"]),
-    )
-    logger.debug("Lattice OK: %s", lt)
+    if logger.isEnabledFor(logging.DEBUG):
+        units = util.units["user"]
+        lt = Lattice(*[v.value_get(units) for v in params])
+        logger.debug("Lattice OK: %s", lt)
 
 
 class HklSample(object):
@@ -118,6 +114,7 @@ class HklSample(object):
         ~__repr__
         ~__str__
         ~_create_reflection
+        ~_get_matrix
         ~_get_reflection_dict
         ~_refl_matrix
         ~_repr_info
@@ -144,6 +141,13 @@ class HklSample(object):
         # the code that sets that up will also need to manage this list.
         self._orientation_reflections = []
 
+        # Incremented by each change to lattice, orientation, or reflections.
+        # Lets callers cache values read from the sample.
+        self._generation = 0
+
+        # U and UB matrices as last read from libhkl: {name: (generation, ndarray)}
+        self._matrix_cache = {}
+
         for name in "lattice name U UB ux uy uz reflections".split():
             value = kwargs.pop(name, None)
             if value is not None:
@@ -221,11 +225,12 @@ class HklSample(object):
     def lattice(self, lattice):
         if not isinstance(lattice, libhkl.Lattice):
             a, b, c, alpha, beta, gamma = lattice
-            alpha, beta, gamma = np.radians((alpha, beta, gamma))
+            alpha, beta, gamma = math.radians(alpha), math.radians(beta), math.radians(gamma)
             lattice = libhkl.Lattice.new(a, b, c, alpha, beta, gamma)
 
         check_lattice(lattice)
         self._sample.lattice_set(lattice)
+        self._generation += 1
         # TODO: notes mention that lattice should not change, but is it alright
         #       if init() is called again? or should reflections be cleared,
         #       etc?
@@ -235,12 +240,21 @@ class HklSample(object):
         """
         The crystal orientation matrix, U
         """
-        return util.to_numpy(self._sample.U_get())
+        return self._get_matrix("U", self._sample.U_get)
 
     @U.setter
     def U(self, new_u):
         self._orientation_reflections = []
         self._sample.U_set(util.to_hkl(new_u))
+        self._generation += 1
+
+    def _get_matrix(self, name, getter):
+        """Return a copy of a matrix, read from libhkl once per sample change."""
+        cached = self._matrix_cache.get(name)
+        if cached is None or cached[0] != self._generation:
+            cached = self._generation, util.to_numpy(getter())
+            self._matrix_cache[name] = cached
+        return cached[1].copy()
 
     def _get_parameter(self, param):
         return Parameter(param, units=self._unit_name)
@@ -276,12 +290,13 @@ class HklSample(object):
         If written to, the B matrix will be kept constant:
             U * B = UB -> U = UB * B^-1
         """
-        return util.to_numpy(self._sample.UB_get())
+        return self._get_matrix("UB", self._sample.UB_get)
 
     @UB.setter
     def UB(self, new_ub):
         self._orientation_reflections = []
         self._sample.UB_set(util.to_hkl(new_ub))
+        self._generation += 1
 
     def _create_reflection(self, h, k, l, detector=None):
         """
@@ -313,7 +328,11 @@ class HklSample(object):
         -------
         UB matrix or raises ``gi.repository.GLib.GError``
         """
-        if self._sample.compute_UB_busing_levy(r1, r2):
+        try:
+            success = self._sample.compute_UB_busing_levy(r1, r2)
+        finally:
+            self._generation += 1
+        if success:
             # TODO: this list defines the order of the orientation reflections
             self._orientation_reflections = [r1, r2]
             return self.UB
@@ -357,11 +376,11 @@ class HklSample(object):
         if detector is None:
             detector = calc._detector
 
-        if compute_ub and len(self.reflections) < 1:
-            raise RuntimeError("Cannot calculate the UB matrix with less than two reflections")
-
         if compute_ub:
-            r1 = self._sample.reflections_get()[-1]
+            reflections = self._sample.reflections_get()
+            if len(reflections) < 1:
+                raise RuntimeError("Cannot calculate the UB matrix with less than two reflections")
+            r1 = reflections[-1]
 
         with TemporaryGeometry(calc):
 
@@ -406,6 +425,7 @@ class HklSample(object):
             if has_valid_position(position):
                 calc.physical_positions = position
             r2 = self._sample.add_reflection(calc._geometry, detector, h, k, l)
+            self._generation += 1
 
         if compute_ub:
             self.compute_UB(r1, r2)
@@ -418,7 +438,10 @@ class HklSample(object):
             index = self.reflections.index(refl)
             refl = self._sample.reflections_get()[index]
 
-        return self._sample.del_reflection(refl)
+        try:
+            return self._sample.del_reflection(refl)
+        finally:
+            self._generation += 1
 
     def clear_reflections(self):
         """Clear all reflections for the current sample."""
@@ -426,17 +449,22 @@ class HklSample(object):
         for refl in reflections:
             self._sample.del_reflection(refl)
         self._orientation_reflections = []
+        self._generation += 1
 
     def _refl_matrix(self, fcn):
-        """Get a reflection angle matrix."""
-        sample = self._sample
-        refl = sample.reflections_get()
-        refl_matrix = np.zeros((len(refl), len(refl)))
+        """Get a reflection angle matrix.
+
+        The angle between two reflections does not depend on their order,
+        so ``fcn`` is called once per pair and the matrix is mirrored.
+        """
+        refl = self._sample.reflections_get()
+        n = len(refl)
+        refl_matrix = np.zeros((n, n))
 
-        for i, r1 in enumerate(refl):
-            for j, r2 in enumerate(refl):
-                if i != j:
-                    refl_matrix[i, j] = fcn(r1, r2)
+        for i in range(n):
+            r1 = refl[i]
+            for j in range(i + 1, n):
+                refl_matrix[i, j] = refl_matrix[j, i] = fcn(r1, refl[j])
 
         return refl_matrix
 
@@ -452,7 +480,10 @@ class HklSample(object):
         """
         Refine (affine) the sample lattice parameters from the list of reflections.
         """
-        return self._sample.affine()
+        try:
+            return self._sample.affine()
+        finally:
+            self._generation += 1
 
     def _repr_info(self):
         r = [
@@ -477,15 +508,21 @@ class HklSample(object):
         info.append(f"reflection_theoretical_angles={self.reflection_theoretical_angles!r}")
         return f"{self.__class__.__name__}({', '.join(info)}))"
 
-    def _get_reflection_dict(self, refl):
-        """Return dictionary with reflection details."""
+    def _get_reflection_dict(self, refl, axis_names=None):
+        """Return dictionary with reflection details.
+
+        ``axis_names`` may be given when details of several reflections
+        (all from this sample's geometry) are collected.
+        """
         h, k, l = refl.hkl_get()
         geom = refl.geometry_get()
+        if axis_names is None:
+            axis_names = geom.axis_names_get()
         return {
             "reflection": {"h": h, "k": k, "l": l},
             "flag": refl.flag_get(),  # not used by hklpy
             "wavelength": geom.wavelength_get(1),
-            "position": dict(zip(geom.axis_names_get(), geom.axis_values_get(1))),
+            "position": dict(zip(axis_names, geom.axis_values_get(1))),
             "orientation_reflection": refl in self._orientation_reflections,
         }
 
@@ -504,7 +541,8 @@ class HklSample(object):
                 # Edge case when orientation reflection was
                 # deleted from the list in libhkl.
                 refls.append(r)
-        return [self._get_reflection_dict(r) for r in refls]
+        axis_names = self._calc._geometry.axis_names_get()
+        return [self._get_reflection_dict(r, axis_names) for r in refls]
 
     def swap_orientation_reflections(self):
         """Swap the 2 [UB] reflections, re-compute & return new [UB]."""
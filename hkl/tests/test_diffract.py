@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import numpy.testing
 import pint
 import pyRestTable
@@ -5,6 +7,7 @@ import pytest
 
 from hkl import SimulatedE4CV
 from hkl.calc import A_KEV
+from hkl.calc import nearest_decision_function
 from hkl.diffract import Constraint
 
 
@@ -101,6 +104,12 @@ def test_energy_units_931eV(fourc):
     numpy.testing.assert_almost_equal(fourc.calc.energy, eV / 1000)
 
 
+def test_energy_units_cached(fourc):
+    assert fourc._energy_units in (None, "keV")  # None: no update seen yet
+    fourc.energy_units.put("eV")
+    assert fourc._energy_units == "eV"
+
+
 def test_energy_units_issue79(fourc):
     # issue #79
     fourc.energy_units.put("eV")
@@ -387,3 +396,225 @@ def test_i303_forward_solution_original_problem(e4cv):
     assert pytest.approx(position.phi, abs=1e-4) == CONSTANT_PHI
 
     e4cv.reset_constraints()
+
+
+def test_cached_connected(fourc):
+    assert fourc._is_connected
+    assert fourc._cached_connected
+
+    # any signal reporting a lost connection forgets the cached state
+    fourc._connection_changed(connected=False)
+    assert not fourc._cached_connected
+
+    fourc.energy.put(5.989)
+    numpy.testing.assert_almost_equal(fourc.calc.energy, 5.989)
+    assert fourc._cached_connected
+
+
+def test_forward_cache(fourc):
+    fourc._forward_cache_size = 128
+    fourc._invalidate_forward_cache()
+    assert len(fourc._forward_cache) == 0
+
+    first = fourc.forward(1, 0, 0)
+    assert len(fourc._forward_cache) == 1
+    assert fourc.forward(1, 0, 0) == first
+    assert len(fourc._forward_cache) == 1
+
+    # a different energy is a different solution
+    fourc.energy.put(fourc.energy.get() * 1.01)
+    assert fourc.forward(1, 0, 0) != first
+    assert len(fourc._forward_cache) == 2
+
+    fourc.apply_constraints({"tth": Constraint(0, 180, 0, True)})
+    assert len(fourc._forward_cache) == 0
+
+
+def test_forward_cache_max_iterations(fourc):
+    fourc._forward_cache_size = 128
+    fourc._invalidate_forward_cache()
+    fourc.forward(1, 0, 0)
+    fourc.max_forward_iterations.put(fourc.max_forward_iterations.get() + 1)
+    fourc.forward(1, 0, 0)
+    assert len(fourc._forward_cache) == 2
+
+
+def test_forward_cache_iter_fallback(fourc, monkeypatch):
+    fourc._forward_cache_size = 128
+    fourc._invalidate_forward_cache()
+    expected = fourc.calc.forward((1, 0, 0))[0]
+
+    def forward_fails(position):
+        raise ValueError("forced failure")
+
+    # forward_iter() result depends on the present position: not remembered
+    monkeypatch.setattr(fourc.calc, "forward", forward_fails)
+    numpy.testing.assert_array_almost_equal(fourc.forward(1, 0, 0), expected)
+    assert len(fourc._forward_cache) == 0
+
+
+def test_forward_cache_size():
+    calls = []
+
+    def decision(position, solutions):
+        calls.append(position)
+        return solutions[0]
+
+    # default: no cache, the decision function is called each time
+    fourc = Fourc("", name="fourc", decision_fcn=decision)
+    fourc.wait_for_connection()
+    fourc.forward(1, 0, 0)
+    fourc.forward(1, 0, 0)
+    assert len(calls) == 2
+    assert len(fourc._forward_cache) == 0
+
+    fourc = Fourc("", name="fourc", decision_fcn=decision, forward_cache_size=4)
+    fourc.wait_for_connection()
+    fourc.forward(1, 0, 0)
+    fourc.forward(1, 0, 0)
+    assert len(calls) == 3
+    assert len(fourc._forward_cache) == 1
+
+
+def test_forward_batch(fourc):
+    hkls = [(1, 0, 0), (0, 1, 0), (1, 1, 0)]
+    reals = fourc.forward_batch(hkls)
+    assert reals.shape == (3, 4)
+    for hkl, row in zip(hkls, reals):
+        numpy.testing.assert_array_almost_equal(row, fourc.forward(hkl))
+
+    assert fourc.forward_batch((1, 0, 0)).shape == (1, 4)
+
+    with pytest.raises(ValueError):
+        fourc.forward_batch([(1, 0)])
+
+
+def test_sample_cached_signals(fourc):
+    sample = fourc.calc.sample
+    ub = fourc.UB.get()
+    numpy.testing.assert_array_equal(fourc.UB.get(), ub)
+    assert fourc.reflections.get() == []
+
+    # changing a returned value in place does not change the cache
+    fourc.UB.get()[0, 0] = 5
+    numpy.testing.assert_array_equal(fourc.UB.get(), ub)
+
+    sample.lattice = (2, 2, 2, 90, 90, 90)
+    numpy.testing.assert_array_almost_equal(fourc.lattice.get(), (2, 2, 2, 90, 90, 90))
+    assert not numpy.allclose(fourc.UB.get(), ub)
+    numpy.testing.assert_array_almost_equal(fourc.UB.get(), sample.UB)
+
+    u = [fourc.ux.get(), fourc.uy.get(), fourc.uz.get()]
+    sample.U = [[0, 0, 1], [0, 1, 0], [-1, 0, 0]]
+    assert [fourc.ux.get(), fourc.uy.get(), fourc.uz.get()] != u
+    numpy.testing.assert_almost_equal(fourc.uy.get(), sample.uy.value)
+
+    sample.add_reflection(1, 0, 0)
+    assert fourc.reflections.get() == [[1, 0, 0]]
+    fourc.reflections.get()[0][0] = 5
+    assert fourc.reflections.get() == [[1, 0, 0]]
+    sample.clear_reflections()
+    assert fourc.reflections.get() == []
+
+
+def test_energy_debounce(fourc):
+    fourc._energy_debounce = 0.05
+    nrg = fourc.calc.energy
+    for value in (9.0, 9.5, 10.0):
+        fourc.energy.put(value)
+    assert fourc.calc.energy == nrg
+
+    timer = fourc._energy_timer
+    timer.join()
+    assert fourc._energy_timer is None
+    numpy.testing.assert_almost_equal(fourc.calc.energy, 10.0)
+
+    # updates disabled while waiting: the pending update does nothing
+    fourc._energy_debounce = 60
+    fourc.energy.put(10.5)
+    fourc._energy_timer.cancel()
+    fourc.energy_update_calc_flag.put(False)
+    fourc._debounced_energy_update()
+    numpy.testing.assert_almost_equal(fourc.calc.energy, 10.0)
+    fourc.energy_update_calc_flag.put(True)
+
+    # destroy() cancels a pending update
+    fourc._energy_debounce = 60
+    fourc.energy.put(11.0)
+    timer = fourc._energy_timer
+    fourc.destroy()
+    timer.join()
+    assert fourc._energy_timer is None
+    numpy.testing.assert_almost_equal(fourc.calc.energy, 10.0)
+
+
+def test_forward_cache_constraints(fourc):
+    fourc._forward_cache_size = 128
+    fourc._invalidate_forward_cache()
+    fourc.forward(1, 0, 0)
+
+    # constraints changed directly, not through apply_constraints()
+    fourc.calc["phi"].limits = (-90, 90)
+    assert len(fourc._forward_cache) == 1
+    fourc.forward(1, 0, 0)
+    assert len(fourc._forward_cache) == 2
+
+
+def test_calc_forward_many(fourc):
+    start = fourc.calc.physical_positions
+    hkls = [(1, 0, 0), (100, 1, 1), (0, 1, 0)]
+    results = fourc.calc.forward_many(hkls)
+    assert len(results) == 3
+    assert results[1] is None
+    for hkl, solutions in zip(hkls[::2], results[::2]):
+        assert solutions == fourc.calc.forward(hkl)
+    assert fourc.calc.physical_positions == start
+
+
+def test_calc_axes(fourc):
+    axes = fourc._calc_axes
+    assert list(axes) == list(fourc.RealPosition._fields)
+    assert fourc._calc_axes is axes
+
+    # add_reflection() restores a copy of the geometry
+    fourc.calc.sample.add_reflection(1, 0, 0, position=(-30, 0, -90, -60))
+    assert fourc._calc_axes is not axes
+
+    fourc.apply_constraints({"tth": Constraint(0, 170, 0, True)})
+    assert fourc.calc["tth"].limits == (0, 170)
+    assert fourc.get_axis_constraints("tth").high_limit == 170
+
+
+def test_nearest_decision_function(fourc):
+    fourc.energy.put(A_KEV / 1.54)
+    fourc._decision_fcn = nearest_decision_function(fourc.calc)
+
+    solutions = fourc.calc.forward((1, 1, 0))
+    assert len(solutions) > 1
+    # move to the last solution, not the default (first) one
+    for axis, value in solutions[-1]._asdict().items():
+        getattr(fourc, axis).move(value)
+    numpy.testing.assert_array_almost_equal(fourc.forward(1, 1, 0), solutions[-1])
+
+
+def test_nearest_decision_function_wraps():
+    calc = SimpleNamespace(physical_positions=(0, 0, 179, 0))
+    decision = nearest_decision_function(calc)
+    solutions = [(0, 0, 170, 0), (0, 0, -179, 0)]
+    assert decision(None, solutions) == solutions[1]
+
+    calc.physical_positions = (0, 0, -179, 0)
+    assert decision(None, [(0, 0, -170, 0), (0, 0, 179, 0)]) == (0, 0, 179, 0)
+
+
+def test_engine_axis_names(fourc):
+    engine = fourc.calc.engine
+    assert engine.pseudo_axis_names == ["h", "k", "l"]
+    with pytest.raises(ValueError, match="Unknown axis name"):
+        engine["q"] = 1
+    with pytest.raises(ValueError, match="Unknown axis name"):
+        engine["q"]
+
+    fourc.move((0, 1, 0))
+    assert engine["k"] == pytest.approx(1)
+    assert engine.pseudo_axes["k"] == engine["k"]
@@ -227,3 +227,40 @@ def test_swap_orientation_reflections(fourc):
         sample.swap_orientation_reflections()
     expected = "Must have exactly 2 orientation reflections defined"
     assert expected in str(exinfo.value)
+
+
+def test_reflection_angles(fourc):
+    sample = fourc.calc.sample
+    assert sample.reflection_theoretical_angles.shape == (0, 0)
+
+    fourc.calc.wavelength = 1.54
+    sample.add_reflection(-1, 0, 0, (30, 0, -90, 60))
+    sample.add_reflection(0, 1, 1, (45, 45, 0, 90))
+    sample.add_reflection(0, 0, 1, (30, 90, 0, 60))
+
+    for angles in (sample.reflection_measured_angles, sample.reflection_theoretical_angles):
+        assert angles.shape == (3, 3)
+        np.testing.assert_array_equal(angles, angles.T)
+        np.testing.assert_array_equal(np.diag(angles), 0)
+
+    theoretical = sample.reflection_theoretical_angles
+    np.testing.assert_array_almost_equal(
+        np.degrees(theoretical),
+        [[0, 90, 90], [90, 0, 45], [90, 45, 0]],
+    )
+
+
+def test_UB_cached_copy(fourc):
+    sample = fourc.calc.sample
+    ub = sample.UB
+    ub[0, 0] = 100
+    assert sample.UB[0, 0] != 100
+    assert sample.UB is not sample.UB
+
+    sample.UB = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    np.testing.assert_array_almost_equal(sample.UB, np.identity(3))
+
+    sample.U = [[0, -1, 0], [1, 0, 0], [0, 0, 1]]
+    np.testing.assert_array_almost_equal(sample.U, [[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+    assert sample.UB[0, 1] < 0
+
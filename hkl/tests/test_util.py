@@ -264,3 +264,11 @@ def test_RE_documents(use_refl, e4cv):
     orientation = util.run_orientation_info(cat[uids[0]])
     assert isinstance(orientation, dict)
     assert e4cv.name in orientation
+
+
+def test_Constraint():
+    c = util.Constraint(-10, "10", 0, 1)
+    assert tuple(c) == (-10.0, 10.0, 0.0, True)
+    assert c._asdict() == dict(low_limit=-10.0, high_limit=10.0, value=0.0, fit=True)
+    assert repr(c) == "Constraint(low_limit=-10.0, high_limit=10.0, value=0.0, fit=True)"
+    assert not hasattr(c, "__dict__")
@@ -10,6 +10,7 @@ from pathlib import Path  # noqa
 
 import numpy
 
+from ..util import SI_LATTICE_PARAMETER
 from ..util import new_lattice
 
 logger = logging.getLogger("ophyd_session_test")
@@ -17,6 +18,10 @@ logger = logging.getLogger("ophyd_session_test")
 TARDIS_TEST_MODE = "lifting_detector_mu"
 TWO_PI = 2 * numpy.pi
 
+KRYPTONITE_LATTICE = new_lattice(4, 5, 6, 75, 85, 95)  # triclinic
+SILICON_LATTICE = new_lattice(SI_LATTICE_PARAMETER)  # cubic
+VIBRANIUM_LATTICE = new_lattice(TWO_PI)  # cubic
+
 
 class DocsCollector:
     """Collect representative documents from the RE."""
@@ -41,21 +46,15 @@ def new_sample(diffractometer, name, lattice):
 
 
 def sample_kryptonite(diffractometer):
-    triclinic = new_lattice(4, 5, 6, 75, 85, 95)
-    return new_sample(diffractometer, "kryptonite", lattice=triclinic)
+    return new_sample(diffractometer, "kryptonite", lattice=KRYPTONITE_LATTICE)
 
 
 def sample_silicon(diffractometer):
-    from .. import SI_LATTICE_PARAMETER
-
-    cubic = new_lattice(SI_LATTICE_PARAMETER)
-    return new_sample(diffractometer, "silicon", lattice=cubic)
+    return new_sample(diffractometer, "silicon", lattice=SILICON_LATTICE)
 
 
 def sample_vibranium(diffractometer):
-    a0 = TWO_PI
-    cubic = new_lattice(a0)
-    return new_sample(diffractometer, "vibranium", lattice=cubic)
+    return new_sample(diffractometer, "vibranium", lattice=VIBRANIUM_LATTICE)
 
 
 def validate_descriptor_doc_content(gname, descriptor):
@@ -189,21 +189,15 @@ class Constraint:
         the calculation of rotation angles from reciprocal-space coordinates.
     """
 
+    _fields = ("low_limit", "high_limit", "value", "fit")
+    __slots__ = _fields
+
     def __init__(self, low_limit, high_limit, value, fit=True):
         self.low_limit = float(low_limit)
         self.high_limit = float(high_limit)
         self.value = float(value)
         self.fit = bool(fit)
 
-        self._fields = "low_limit high_limit value fit".split()
-        # fmt: off
-        _fields = ", ".join(
-            name + "=" + repr(getattr(self, name))
-            for name in self._fields
-        )
-        # fmt: on
-        self._repr_fmt = f"({_fields})"
-
     def _asdict(self):
         "Return a new dict which maps field names to their values."
         return dict(zip(self._fields, self))